@@ -0,0 +1,31 @@
+"""Optional build script that compiles the `casting` hot path to a C
+extension with Cython. The compiled module shadows `casting.py` when
+present; without Cython or a C compiler the package runs the pure
+Python module unchanged.
+
+Build in place with:
+
+- `python setup.py build_ext --inplace`
+"""
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize(
+        ["src/strictdataclass/casting.py"],
+        compiler_directives={
+            "language_level": "3",
+            "boundscheck": False,
+            "wraparound": False,
+            "nonecheck": False,
+        },
+        exclude_failures=True,
+    )
+except ImportError:
+    ext_modules = []
+
+setup(
+    packages=["strictdataclass"],
+    package_dir={"": "src"},
+    ext_modules=ext_modules,
+)
@@ -7,11 +7,12 @@ This module also contains the `ObjectTypeNotCastableError` error class
 that is thrown during a failed attempt at type casting
 """
 from dataclasses import asdict, dataclass, fields
-from typing import Any, Iterator
-from any_cast import cast
-from instancemethod import instancemethod
+from sys import intern
+from typing import Any, ClassVar, Iterator
+from .casting import _resolve_caster, ObjectTypeNotCastableError
 __all__ = [
     "StrictDataclass",
+    "ObjectTypeNotCastableError",
 ]
 __refs__ = {
     "AUTHOR": {
@@ -47,26 +48,144 @@ class StrictDataclass:
     - __delitem__ & __delattr__: Disabled to prevent dataclass errors.
 
     Custom class & instance methods:
-    - all_fields: Property (list) containing the class's field names.
-    - fields_dict: Property (dict) containg the class's field 
+    - all_fields: Property (tuple) containing the class's field names.
+    - fields_dict: Property (dict) containg the class's field
     names and types.
     - create_default: Abstract method that returns an error with the
     suggested implementations if inheriting classes do not override.
+    - bulk_construct: Builds a list of instances from parallel
+    per-field columns, casting each column in a single pass.
 
     Custom instance-only methods:
     - type_cast_fields: Iteratively attempts to cast each attribute
     to the class's field type for that attribute.
-    - to_dict: Returns a pure-type dictionary representation of an 
+    - to_dict: Returns a pure-type dictionary representation of an
     instance.
+    - to_shallow_dict: Returns a dictionary of an instance's field
+    names and attribute values without recursing.
     """
+    __strict_fields_dict__: ClassVar[dict[str, Any] | None] = None
+    __strict_field_names__: ClassVar[tuple[str, ...] | None] = None
+    __strict_casters__: ClassVar[dict[str, Any] | None] = None
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        # Resetting the caches so each subclass rebuilds its own from
+        # its own fields (the `dataclass` decorator has not run yet)
+        super().__init_subclass__(**kwargs)
+        cls.__strict_fields_dict__ = None
+        cls.__strict_field_names__ = None
+        cls.__strict_casters__ = None
+
+    @classmethod
+    def _cache_fields(cls) -> None:
+        """Builds and caches the class's field name/type lookups the
+        first time they are needed, avoiding a `dataclasses.fields`
+        walk on every access.
+        """
+        cls.__strict_fields_dict__ = {
+            field.name: field.type for field in fields(cls)
+        }
+        cls.__strict_field_names__ = tuple(
+            intern(field.name) for field in fields(cls)
+        )
+        cls.__strict_casters__ = {
+            name: _resolve_caster(field_type)
+            for name, field_type in cls.__strict_fields_dict__.items()
+        }
+        cls._compile_type_cast_fields()
+
+    @classmethod
+    def _compile_type_cast_fields(cls) -> None:
+        """Generates a `type_cast_fields` specialized to the class's
+        fields: one straight-line call to the field's resolved caster
+        per field with no loop, dict lookup, or item-dunder dispatch.
+
+        Classes that override `type_cast_fields` are left alone.
+        """
+        generic = StrictDataclass.__dict__["type_cast_fields"]
+        for klass in cls.__mro__:
+            existing = klass.__dict__.get("type_cast_fields")
+            if existing is not None:
+                break
+        if existing is not generic \
+                and not getattr(existing, "__strict_compiled__", False):
+            return
+        namespace: dict[str, Any] = {}
+        lines = ["def type_cast_fields(self) -> None:"]
+        if not cls.__strict_field_names__:
+            lines.append("    pass")
+        for index, name in enumerate(cls.__strict_field_names__):
+            namespace[f"_c{index}"] = cls.__strict_casters__[name]
+            lines.append(f"    self.{name} = _c{index}(self.{name})")
+        exec("\n".join(lines), namespace)
+        compiled = namespace["type_cast_fields"]
+        compiled.__strict_compiled__ = True
+        cls.type_cast_fields = compiled
+
+    @classmethod
+    def bulk_construct(cls, **columns: Any) -> list:
+        """Builds a list of instances from parallel per-field columns,
+        casting each column in one pass instead of per-instance.
+
+        Columns must cover every field and share one length. Numeric
+        fields given NumPy arrays are casted with a single vectorized
+        `astype` call; other columns are casted element-wise through
+        the field's resolved caster. Instances are allocated directly,
+        so `__init__`/`__post_init__` side effects do not run.
+        """
+        if cls.__strict_fields_dict__ is None:
+            cls._cache_fields()
+        names = cls.__strict_field_names__
+        if set(columns) != set(names):
+            error_message = f"Bulk constructing `{cls}` requires exactly "\
+                + f"the columns `{names}`"
+            raise TypeError(error_message)
+        lengths = {len(column) for column in columns.values()}
+        if len(lengths) > 1:
+            error_message = f"Bulk constructing `{cls}` requires columns "\
+                + f"of a single shared length, not `{sorted(lengths)}`"
+            raise ValueError(error_message)
+        casted_columns = []
+        for name in names:
+            column = columns[name]
+            field_type = cls.__strict_fields_dict__[name]
+            if field_type in (int, float, bool) \
+                    and hasattr(column, "astype"):
+                casted_columns.append(column.astype(field_type).tolist())
+            else:
+                casted_columns.append(
+                    list(map(cls.__strict_casters__[name], column))
+                )
+        instances = []
+        new_instance = object.__new__
+        append = instances.append
+        for values in zip(*casted_columns):
+            instance = new_instance(cls)
+            instance.__dict__.update(zip(names, values))
+            append(instance)
+        return instances
+
     def __post_init__(self) -> None:
+        if type(self).__strict_fields_dict__ is None:
+            type(self)._cache_fields()
         self.type_cast_fields()
 
     def __getitem__(self, item: int | str) -> Any:
-        if isinstance(item, int):
-            return self.__getattribute__(fields(self)[item].name)
+        # Exact-type checks are pointer comparisons; isinstance below
+        # is the slow path for int/str subclasses
+        item_type = type(item)
+        if item_type is int:
+            names = type(self).__strict_field_names__
+            if names is None:
+                type(self)._cache_fields()
+                names = type(self).__strict_field_names__
+            return getattr(self, names[item])
+        elif item_type is str:
+            return getattr(self, intern(item))
+        elif isinstance(item, int):
+            return self[int(item)]
         elif isinstance(item, str):
-            return self.__getattribute__(item)
+            return getattr(self, intern(item))
         else:
             raise NotImplementedError(
                 f"Accessing `{type(self)}` attributes "\
@@ -74,10 +193,19 @@ class StrictDataclass:
             )
 
     def __setitem__(self, item: int | str, value: Any) -> None:
-        if isinstance(item, int):
-            self.__setattr__(fields(self)[item].name, value)
+        item_type = type(item)
+        if item_type is int:
+            names = type(self).__strict_field_names__
+            if names is None:
+                type(self)._cache_fields()
+                names = type(self).__strict_field_names__
+            object.__setattr__(self, names[item], value)
+        elif item_type is str:
+            object.__setattr__(self, intern(item), value)
+        elif isinstance(item, int):
+            self[int(item)] = value
         elif isinstance(item, str):
-            self.__setattr__(item, value)
+            object.__setattr__(self, intern(item), value)
         else:
             error_message = f"Setting `{type(self)}` attribute by "\
                 + f"`{type(item)}` is not supported"
@@ -94,35 +222,64 @@ class StrictDataclass:
         raise NotImplementedError(error_message)
     
     def __iter__(self) -> Iterator:
-        return iter([{k: v} for k, v in self.to_dict().items()])
-    
+        names = type(self).__strict_field_names__
+        if names is None:
+            type(self)._cache_fields()
+            names = type(self).__strict_field_names__
+        return ({name: getattr(self, name)} for name in names)
+
     def __len__(self) -> int:
-        return len([{k: v} for k, v in self.to_dict().items()])
+        names = type(self).__strict_field_names__
+        if names is None:
+            type(self)._cache_fields()
+            names = type(self).__strict_field_names__
+        return len(names)
 
     @classproperty
-    def all_fields(cls) -> list[str]:
-        """Returns a list of the class's field names."""
-        return [field.name for field in fields(cls)]
-    
+    def all_fields(cls) -> tuple[str, ...]:
+        """Returns a tuple of the class's field names."""
+        if cls.__strict_field_names__ is None:
+            cls._cache_fields()
+        return cls.__strict_field_names__
+
     @classproperty
     def fields_dict(cls) -> dict[str, Any]:
         """Returns a dict of the class's field names and types."""
-        return {field.name: field.type for field in fields(cls)}
+        if cls.__strict_fields_dict__ is None:
+            cls._cache_fields()
+        return cls.__strict_fields_dict__
 
-    @instancemethod
     def type_cast_fields(self) -> None:
         """Attempts to cast all instance attribute values to the
         annotated type.
-        
+
         Can throw `ObjectTypeNotCastableError` in unsupported type
         cases.
         """
-        for key, field_type in self.fields_dict.items():
-            self[key] = cast(self[key], field_type)
+        cls = type(self)
+        casters = cls.__strict_casters__
+        if casters is None:
+            cls._cache_fields()
+            casters = cls.__strict_casters__
+        # Hoisting the attribute helpers to locals keeps the loop body
+        # on LOAD_FAST lookups only
+        set_attribute = object.__setattr__
+        get_attribute = object.__getattribute__
+        for name, caster in casters.items():
+            set_attribute(self, name, caster(get_attribute(self, name)))
 
-    @instancemethod
     def to_dict(self) -> dict[str, Any]:
         """Returns a pure-type representation of the object using
         dataclasses.asdict.
         """
         return asdict(self)
+
+    def to_shallow_dict(self) -> dict[str, Any]:
+        """Returns a dict of the instance's field names and attribute
+        values without the recursive copying of dataclasses.asdict.
+        """
+        names = type(self).__strict_field_names__
+        if names is None:
+            type(self)._cache_fields()
+            names = type(self).__strict_field_names__
+        return {name: getattr(self, name) for name in names}
@@ -0,0 +1,382 @@
+"""This module contains the type casting functions used by
+`StrictDataclass` to coerce attribute values to their annotated field
+types, and the `ObjectTypeNotCastableError` error class that is thrown
+during a failed attempt at type casting.
+
+The `cast_to_*` functions perform generic per-value dispatch. The
+`_resolve_caster` function resolves a field type to a single-argument
+casting function once at class-definition time so that no typing
+introspection happens on the per-instance hot path.
+"""
+from datetime import date, datetime
+from functools import lru_cache
+from types import UnionType
+from typing import Any, Callable, get_args, get_origin, Union
+from dateutil.parser import parse
+__all__ = [
+    "ObjectTypeNotCastableError",
+    "cast_to_any_type",
+    "cast_to_bool",
+    "cast_to_complex_type",
+    "cast_to_custom_type",
+    "cast_to_multiple_types",
+    "cast_to_simple_type",
+]
+_NONE_TYPE = type(None)
+__refs__ = {
+    "AUTHOR": {
+        "Name": "Braden Toone",
+        "Email": "braden@toonetown.com"
+    },
+    "HOMEPAGE": "https://github.com/Braden2n/StrictDataclass",
+    "DOCUMENTATION": "https://github.com/Braden2n/StrictDataclass",
+    "ISSUES": "https://github.com/Braden2n/StrictDataclass/issues",
+    "REPOSITORY": "https://github.com",
+    "CHANGELOG": "https://github.com/Braden2n/StrictDataclass/activity",
+}
+
+
+class ObjectTypeNotCastableError(TypeError):
+    """Raised when a value cannot be casted to the requested type."""
+    def __init__(self, cast_value: Any, cast_type: Any) -> None:
+        message = f"`{cast_value}` of type `{type(cast_value)}` is not "\
+            + f"castable to `{cast_type}`"
+        super().__init__(message)
+
+
+@lru_cache(maxsize=1024)
+def _classify_type(cast_type: Any) -> tuple[str, Any, tuple | None]:
+    """Classifies `cast_type` into a `(kind, origin, type_args)`
+    record. The decision is a pure function of the type, so repeated
+    casts of the same type reuse the cached record instead of redoing
+    the typing introspection.
+    """
+    if cast_type == Any:
+        return ("any", None, None)
+    if isinstance(cast_type, tuple):
+        return ("multiple", None, cast_type)
+    origin = get_origin(cast_type)
+    if origin is not None:
+        if origin == Union or origin == UnionType:
+            return ("union", origin, get_args(cast_type))
+        return ("complex", origin, get_args(cast_type))
+    if cast_type == bool:
+        return ("bool", None, None)
+    if cast_type == date:
+        return ("date", None, None)
+    if cast_type == datetime:
+        return ("datetime", None, None)
+    if isinstance(cast_type, type):
+        return ("class", None, None)
+    return ("simple", None, None)
+
+
+def _cast_any(
+    cast_value: Any, cast_type: Any, origin: Any, type_args: tuple | None
+) -> Any:
+    return cast_value
+
+
+def _cast_multiple(
+    cast_value: Any, cast_type: Any, origin: Any, type_args: tuple | None
+) -> Any:
+    return cast_to_multiple_types(cast_value, type_args)
+
+
+def _cast_union(
+    cast_value: Any, cast_type: Any, origin: Any, type_args: tuple | None
+) -> Any:
+    if cast_value is None and _NONE_TYPE in type_args:
+        return cast_value
+    return cast_to_multiple_types(cast_value, type_args)
+
+
+def _cast_complex(
+    cast_value: Any, cast_type: Any, origin: Any, type_args: tuple | None
+) -> Any:
+    return cast_to_complex_type(cast_value, cast_type, origin, type_args)
+
+
+def _cast_bool(
+    cast_value: Any, cast_type: Any, origin: Any, type_args: tuple | None
+) -> Any:
+    return cast_to_bool(cast_value)
+
+
+def _cast_date(
+    cast_value: Any, cast_type: Any, origin: Any, type_args: tuple | None
+) -> Any:
+    if isinstance(cast_value, date):
+        return cast_value
+    return parse(cast_value).date()
+
+
+def _cast_datetime(
+    cast_value: Any, cast_type: Any, origin: Any, type_args: tuple | None
+) -> Any:
+    if isinstance(cast_value, datetime):
+        return cast_value
+    return parse(cast_value)
+
+
+def _cast_class(
+    cast_value: Any, cast_type: Any, origin: Any, type_args: tuple | None
+) -> Any:
+    if isinstance(cast_value, cast_type):
+        return cast_value
+    return cast_to_simple_type(cast_value, cast_type)
+
+
+def _cast_simple(
+    cast_value: Any, cast_type: Any, origin: Any, type_args: tuple | None
+) -> Any:
+    return cast_to_simple_type(cast_value, cast_type)
+
+
+_KIND_CASTERS: dict[str, Callable[[Any, Any, Any, tuple | None], Any]] = {
+    "any": _cast_any,
+    "multiple": _cast_multiple,
+    "union": _cast_union,
+    "complex": _cast_complex,
+    "bool": _cast_bool,
+    "date": _cast_date,
+    "datetime": _cast_datetime,
+    "class": _cast_class,
+    "simple": _cast_simple,
+}
+
+
+def cast_to_any_type(cast_value: Any, cast_type: Any) -> Any:
+    """Attempts to cast `cast_value` to `cast_type`, dispatching to the
+    appropriate casting function for the type structure.
+
+    Can throw `ObjectTypeNotCastableError` in unsupported type cases.
+    """
+    kind, origin, type_args = _classify_type(cast_type)
+    return _KIND_CASTERS[kind](cast_value, cast_type, origin, type_args)
+
+
+def cast_to_multiple_types(cast_value: Any, cast_types: tuple) -> Any:
+    """Attempts to cast `cast_value` to each type in `cast_types`,
+    returning the first successful cast.
+
+    Throws `ObjectTypeNotCastableError` when every candidate fails,
+    instead of silently falling through to `None`.
+    """
+    for cast_type in cast_types:
+        try:
+            return cast_to_any_type(cast_value, cast_type)
+        except (ObjectTypeNotCastableError, TypeError, ValueError):
+            continue
+    raise ObjectTypeNotCastableError(cast_value, cast_types)
+
+
+def _build_list(cast_value: Any, type_args: tuple) -> list:
+    return [cast_to_any_type(value, type_args[0]) for value in cast_value]
+
+
+def _build_set(cast_value: Any, type_args: tuple) -> set:
+    return {cast_to_any_type(value, type_args[0]) for value in cast_value}
+
+
+def _build_tuple(cast_value: Any, type_args: tuple) -> tuple:
+    if len(type_args) == 2 and type_args[1] is Ellipsis:
+        return tuple(
+            cast_to_any_type(value, type_args[0]) for value in cast_value
+        )
+    return tuple(
+        cast_to_any_type(value, arg)
+        for value, arg in zip(cast_value, type_args)
+    )
+
+
+def _build_dict(cast_value: Any, type_args: tuple) -> dict:
+    return {
+        cast_to_any_type(key, type_args[0]):
+            cast_to_any_type(value, type_args[1])
+        for key, value in cast_value.items()
+    }
+
+
+_CONTAINER_BUILDERS: dict[type, Callable[[Any, tuple], Any]] = {
+    list: _build_list,
+    set: _build_set,
+    tuple: _build_tuple,
+    dict: _build_dict,
+}
+
+
+def cast_to_complex_type(
+    cast_value: Any,
+    cast_type: Any,
+    origin: Any = None,
+    type_args: tuple | None = None,
+) -> Any:
+    """Attempts to cast `cast_value` to the parameterized container or
+    union structure described by `cast_type`.
+
+    `origin` and `type_args` may be passed precomputed (e.g. from
+    `_classify_type`) to skip re-running `get_origin`/`get_args`.
+    """
+    if origin is None:
+        origin = get_origin(cast_type)
+        type_args = get_args(cast_type)
+    builder = _CONTAINER_BUILDERS.get(origin)
+    if builder is not None:
+        return builder(cast_value, type_args)
+    if origin == Union or origin == UnionType:
+        return cast_to_multiple_types(cast_value, type_args)
+    raise ObjectTypeNotCastableError(cast_value, cast_type)
+
+
+_TRUE_BOOLS = frozenset(("1", "TRUE", "T"))
+
+
+def cast_to_bool(cast_value: Any) -> bool:
+    """Attempts to cast `cast_value` to a boolean using truthy string
+    and numeric representations.
+    """
+    if cast_value is True or cast_value is False:
+        return cast_value
+    if isinstance(cast_value, (int, float)):
+        return bool(cast_value)
+    return str(cast_value).upper() in _TRUE_BOOLS
+
+
+def cast_to_simple_type(cast_value: Any, cast_type: Any) -> Any:
+    """Attempts to cast `cast_value` by calling `cast_type` directly,
+    falling back to custom construction on failure.
+    """
+    if not callable(cast_type):
+        raise ObjectTypeNotCastableError(cast_value, cast_type)
+    try:
+        return cast_type(cast_value)
+    except (TypeError, ValueError):
+        return cast_to_custom_type(cast_value, cast_type)
+
+
+def cast_to_custom_type(cast_value: Any, cast_type: Callable) -> Any:
+    """Attempts to cast `cast_value` to a custom type, dispatching on
+    the value's shape to pick the constructor call form.
+    """
+    if isinstance(cast_value, dict):
+        try:
+            return cast_type(**cast_value)
+        except TypeError:
+            pass
+    elif isinstance(cast_value, (list, tuple, set)):
+        try:
+            return cast_type(*cast_value)
+        except TypeError:
+            pass
+    try:
+        return cast_type(cast_value)
+    except (TypeError, ValueError):
+        raise ObjectTypeNotCastableError(cast_value, cast_type)
+
+
+# Element types whose constructor both casts and validates entirely in
+# C, letting homogeneous containers build via map() with no Python
+# frame per element. bool is excluded: bool("0") is truthiness, not a
+# cast.
+_C_LEVEL_CASTERS = frozenset((int, float, str, bytes))
+
+
+def _resolve_multiple_caster(cast_types: tuple) -> Callable[[Any], Any]:
+    """Resolves a tuple of candidate types to a casting function that
+    returns values already matching one of the class-type candidates
+    without raising and catching an exception per failed arm.
+    """
+    instance_types = tuple(
+        cast_type for cast_type in cast_types
+        if isinstance(cast_type, type)
+    )
+    if not instance_types:
+        return lambda cast_value: cast_to_multiple_types(
+            cast_value, cast_types
+        )
+    return lambda cast_value: cast_value \
+        if isinstance(cast_value, instance_types) \
+        else cast_to_multiple_types(cast_value, cast_types)
+
+
+def _resolve_caster(field_type: Any) -> Callable[[Any], Any]:
+    """Resolves `field_type` to a single-argument casting function.
+
+    Dispatch decisions that `cast_to_any_type` makes on every call are
+    made exactly once here, so the returned function only performs the
+    casting work itself.
+    """
+    if field_type == Any:
+        return lambda cast_value: cast_value
+    if isinstance(field_type, tuple):
+        return _resolve_multiple_caster(field_type)
+    origin = get_origin(field_type)
+    if origin is not None:
+        type_args = get_args(field_type)
+        if origin == Union or origin == UnionType:
+            if _NONE_TYPE in type_args:
+                inner_args = tuple(
+                    arg for arg in type_args if arg is not _NONE_TYPE
+                )
+                inner_caster = _resolve_caster(
+                    inner_args[0] if len(inner_args) == 1 else inner_args
+                )
+                return lambda cast_value: cast_value \
+                    if cast_value is None else inner_caster(cast_value)
+            return _resolve_multiple_caster(type_args)
+        if issubclass(origin, list):
+            inner_type = type_args[0]
+            if inner_type in _C_LEVEL_CASTERS:
+                return lambda cast_value: list(map(inner_type, cast_value))
+            inner_caster = _resolve_caster(inner_type)
+            return lambda cast_value: [
+                inner_caster(value) for value in cast_value
+            ]
+        if issubclass(origin, set):
+            inner_type = type_args[0]
+            if inner_type in _C_LEVEL_CASTERS:
+                return lambda cast_value: set(map(inner_type, cast_value))
+            inner_caster = _resolve_caster(inner_type)
+            return lambda cast_value: {
+                inner_caster(value) for value in cast_value
+            }
+        if issubclass(origin, tuple):
+            if len(type_args) == 2 and type_args[1] is Ellipsis:
+                inner_type = type_args[0]
+                if inner_type in _C_LEVEL_CASTERS:
+                    return lambda cast_value: tuple(
+                        map(inner_type, cast_value)
+                    )
+                inner_caster = _resolve_caster(inner_type)
+                return lambda cast_value: tuple(
+                    inner_caster(value) for value in cast_value
+                )
+            inner_casters = tuple(_resolve_caster(arg) for arg in type_args)
+            return lambda cast_value: tuple(
+                caster(value)
+                for caster, value in zip(inner_casters, cast_value)
+            )
+        if issubclass(origin, dict):
+            key_caster = _resolve_caster(type_args[0])
+            value_caster = _resolve_caster(type_args[1])
+            return lambda cast_value: {
+                key_caster(key): value_caster(value)
+                for key, value in cast_value.items()
+            }
+        return lambda cast_value: cast_to_complex_type(
+            cast_value, field_type
+        )
+    if field_type == bool:
+        return cast_to_bool
+    if field_type == date:
+        return lambda cast_value: cast_value \
+            if isinstance(cast_value, date) else parse(cast_value).date()
+    if field_type == datetime:
+        return lambda cast_value: cast_value \
+            if isinstance(cast_value, datetime) else parse(cast_value)
+    if isinstance(field_type, type):
+        return lambda cast_value: cast_value \
+            if isinstance(cast_value, field_type) \
+            else cast_to_simple_type(cast_value, field_type)
+    return lambda cast_value: cast_to_any_type(cast_value, field_type)